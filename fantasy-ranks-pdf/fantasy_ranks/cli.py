@@ -1,38 +1,45 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib
 import subprocess
 import os
 import sys
 from datetime import date
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from fantasy_ranks.models import ScoringEnum
-from fantasy_ranks.providers.espn_editorial import ESPNEditorialProvider
-from fantasy_ranks.providers.sleeper_adp import SleeperADPProvider
-from fantasy_ranks.providers.yahoo_editorial import YahooEditorialProvider
-from fantasy_ranks.render.pdf import render_rankings_pdf
-from fantasy_ranks.render.pdf import render_consensus_pdf
-from fantasy_ranks.utils.tables import ensure_columns, filter_positions
-from fantasy_ranks.utils.consensus import build_consensus
-from fantasy_ranks.utils.analytics import add_tiers, add_vorp
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas, httpx, fpdf and the parsers are imported inside the commands so that
+# `--help` and the chosen source do not pay for every provider's dependencies.
 
 app = typer.Typer(add_completion=False, help="Export fantasy rankings to a styled PDF")
 console = Console()
 
 
+# "module:Class" per source; only the selected provider's module is imported
+_PROVIDERS = {
+    "espn-editorial": "fantasy_ranks.providers.espn_editorial:ESPNEditorialProvider",
+    "sleeper-adp": "fantasy_ranks.providers.sleeper_adp:SleeperADPProvider",
+    "yahoo-editorial": "fantasy_ranks.providers.yahoo_editorial:YahooEditorialProvider",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def _get_provider(source: str):
-    if source == "espn-editorial":
-        return ESPNEditorialProvider()
-    if source == "sleeper-adp":
-        return SleeperADPProvider()
-    if source == "yahoo-editorial":
-        return YahooEditorialProvider()
-    raise typer.BadParameter(f"Unsupported source: {source}")
+    target = _PROVIDERS.get(source)
+    if target is None:
+        raise typer.BadParameter(f"Unsupported source: {source}")
+    module_name, _, cls_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), cls_name)()
 
 
 @app.callback(invoke_without_command=True)
@@ -51,8 +58,14 @@ def export(
     vorp: bool = typer.Option(False, help="Annotate VORP using inverse-rank proxy."),
 ):
     """Export rankings to a PDF (or CSV to stdout)."""
+    from fantasy_ranks.render.pdf import render_rankings_pdf
+    from fantasy_ranks.utils.analytics import add_tiers, add_vorp
+    from fantasy_ranks.utils.tables import ensure_columns
+
     provider = _get_provider(source)
-    pos_list = [p.strip() for p in positions.split(",")] if positions else None
+    # --only takes precedence over --positions; the provider applies it in one pass
+    selected = only or positions
+    pos_list = [p.strip() for p in selected.split(",")] if selected else None
 
     console.status("Fetching rankings...")
     df = provider.fetch(scoring, positions=pos_list, limit=limit)
@@ -64,7 +77,6 @@ def export(
     # Normalize and ensure required columns; guard against empty provider results
     if df.empty:
         console.print("No data parsed from provider; try --raw to debug.", style="yellow")
-    df = filter_positions(df, only.split(",")) if only else filter_positions(df, pos_list)
     df = ensure_columns(df, include_bye=include_bye)
     if tiers:
         df = add_tiers(df)
@@ -117,12 +129,20 @@ def compare(
     out: Path = typer.Option(Path("./Consensus.pdf"), help="Output PDF path."),
 ):
     """Build a consensus across sources and export a two-page PDF."""
-    providers_map = {s.strip(): _get_provider(s.strip()) for s in sources.split(",")}
-    data = {}
+    from fantasy_ranks.providers.base import run_sync
+    from fantasy_ranks.render.pdf import render_consensus_pdf
+    from fantasy_ranks.utils.consensus import build_consensus
+
+    providers_map = {s: _get_provider(s) for s in map(str.strip, sources.split(","))}
+
+    async def _fetch_all() -> list[pd.DataFrame]:
+        return await asyncio.gather(
+            *(p.fetch_async(scoring, limit=limit) for p in providers_map.values())
+        )
+
     with console.status("Fetching sources..."):
-        for name, provider in providers_map.items():
-            df = provider.fetch(scoring, limit=limit)
-            data[name] = df
+        results = run_sync(_fetch_all())
+    data = dict(zip(providers_map, results, strict=True))
     consensus = build_consensus(data)
     pdf_bytes = render_consensus_pdf(consensus, style="dark" if style == "dark" else "light")
     out.parent.mkdir(parents=True, exist_ok=True)
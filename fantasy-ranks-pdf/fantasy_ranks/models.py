@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date
 from enum import Enum
-from typing import Literal, Optional
-
-from pydantic import BaseModel, Field
+from typing import Literal, Optional, get_args
 
 Scoring = Literal["ppr", "half", "standard"]
+Position = Literal["QB", "RB", "WR", "TE", "K", "DST"]
+
+# Positions accepted by PlayerRank.pos, for vectorized validation of whole frames
+POSITIONS = get_args(Position)
 
 
 class ScoringEnum(str, Enum):
@@ -15,7 +18,8 @@ class ScoringEnum(str, Enum):
     standard = "standard"
 
 
-class PlayerRank(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PlayerRank:
     """Represents a single player's ranking row.
 
     Attributes:
@@ -28,14 +32,18 @@ class PlayerRank(BaseModel):
         scoring: Scoring format used.
         date: Ranking publication or fetch date.
         notes: Optional free-form notes.
+
+    Providers build DataFrames, not records; this class fixes the column schema and order,
+    and frames are validated column-wise against it.
     """
 
     name: str
     team: str
-    pos: Literal["QB", "RB", "WR", "TE", "K", "DST"]
+    pos: Position
     rank: int
     bye: Optional[int] = None
-    source: str = Field(default="espn-editorial")
+    source: str = "espn-editorial"
     scoring: Scoring
     date: date
     notes: Optional[str] = None
+
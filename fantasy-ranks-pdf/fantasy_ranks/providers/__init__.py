@@ -1,8 +1,28 @@
-from .base import Provider
-from .espn_editorial import ESPNEditorialProvider
-from .espn_api import ESPNAPIProvider
-from .sleeper_adp import SleeperADPProvider
-from .yahoo_editorial import YahooEditorialProvider
+"""Ranking providers.
+
+Provider classes are resolved lazily (PEP 562) so importing one provider does not
+import every other provider module and its parsing dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import Provider
+    from .espn_api import ESPNAPIProvider
+    from .espn_editorial import ESPNEditorialProvider
+    from .sleeper_adp import SleeperADPProvider
+    from .yahoo_editorial import YahooEditorialProvider
+
+_NAME_TO_MOD = {
+    "Provider": "fantasy_ranks.providers.base",
+    "ESPNEditorialProvider": "fantasy_ranks.providers.espn_editorial",
+    "ESPNAPIProvider": "fantasy_ranks.providers.espn_api",
+    "SleeperADPProvider": "fantasy_ranks.providers.sleeper_adp",
+    "YahooEditorialProvider": "fantasy_ranks.providers.yahoo_editorial",
+}
 
 __all__ = [
     "Provider",
@@ -11,3 +31,14 @@ __all__ = [
     "SleeperADPProvider",
     "YahooEditorialProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _NAME_TO_MOD.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,12 +1,53 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+from typing import Any, ClassVar, Coroutine, Dict, Iterable, Optional, TypeVar
+import weakref
 
+import httpx
 import pandas as pd
 
 from fantasy_ranks.models import Scoring
 
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.0 Safari/605.1.15"
+)
+
+T = TypeVar("T")
+
+_MAX_ATTEMPTS = 4
+_MAX_BACKOFF_SECONDS = 8.0
+_MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Exponential backoff with jitter: ~0.5s, 1s, 2s, ... capped at 8s."""
+    return min(0.5 * 2.0**attempt + random.uniform(0, 0.25), _MAX_BACKOFF_SECONDS)
+
+
+def _retry_after_seconds(resp: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date), if present."""
+    raw = resp.headers.get("retry-after")
+    if not raw:
+        return None
+    try:
+        seconds = float(raw)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER_SECONDS)
+
 
 class Provider(ABC):
     """Abstract provider.
@@ -23,6 +64,11 @@ class Provider(ABC):
     name: str = "base"
     homepage_url: str = ""
 
+    # One pooled client per event loop, shared by every provider running on that loop
+    _async_clients: ClassVar[
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+    ] = weakref.WeakKeyDictionary()
+
     @abstractmethod
     def fetch(
         self,
@@ -33,3 +79,95 @@ class Provider(ABC):
     ) -> pd.DataFrame:
         """Fetch rankings for a scoring format as a DataFrame."""
         raise NotImplementedError
+
+    async def fetch_async(
+        self,
+        scoring: Scoring,
+        *,
+        positions: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Async variant of :meth:`fetch`.
+
+        Defaults to running the blocking ``fetch`` in a worker thread; network-bound
+        providers override this with native ``await client.get(...)`` calls.
+        """
+        return await asyncio.to_thread(self.fetch, scoring, positions=positions, limit=limit)
+
+    @classmethod
+    def async_client(cls) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client for the running loop, creating it lazily."""
+        loop = asyncio.get_running_loop()
+        client = Provider._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=20.0,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+            )
+            Provider._async_clients[loop] = client
+        return client
+
+    async def get_with_retries(
+        self, url: str, *, headers: Optional[Dict[str, str]] = None, what: str
+    ) -> httpx.Response:
+        """GET ``url`` with the shared client, retrying transient failures.
+
+        Transport errors, 429 and 5xx responses are retried with exponential backoff, or
+        after the server's Retry-After; other 4xx fail at once. A ``304 Not Modified`` is
+        returned as-is for conditional requests. Raises ``RuntimeError`` naming ``what``.
+        """
+        client = self.async_client()
+        last_exc: Optional[Exception] = None
+        for attempt in range(_MAX_ATTEMPTS):
+            delay: Optional[float] = None
+            try:
+                resp = await client.get(url, headers=headers)
+                if resp.status_code == httpx.codes.NOT_MODIFIED:
+                    return resp
+                resp.raise_for_status()
+                return resp
+            except httpx.HTTPStatusError as exc:
+                status = exc.response.status_code
+                if status != httpx.codes.TOO_MANY_REQUESTS and httpx.codes.is_client_error(status):
+                    # Client errors will not succeed on retry
+                    raise RuntimeError(f"Failed to fetch {what}: {url}\n{exc}") from exc
+                last_exc = exc
+                delay = _retry_after_seconds(exc.response)
+            except Exception as exc:  # noqa: BLE001
+                last_exc = exc
+            if attempt + 1 < _MAX_ATTEMPTS:
+                await asyncio.sleep(delay if delay is not None else _backoff_seconds(attempt))
+        raise RuntimeError(f"Failed to fetch {what}: {url}\n{last_exc}")
+
+    @classmethod
+    async def aclose_client(cls) -> None:
+        """Close the shared client bound to the running loop, if any."""
+        client = Provider._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a provider coroutine to completion and release the loop's pooled client.
+
+    Inside an already running event loop (a notebook, an async app) the coroutine gets
+    its own loop on a worker thread and the caller blocks until it finishes; async
+    callers should await ``fetch_async`` instead.
+    """
+
+    async def _main() -> T:
+        try:
+            return await coro
+        finally:
+            await Provider.aclose_client()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+    # asyncio.run refuses to nest inside a running loop
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(lambda: asyncio.run(_main())).result()
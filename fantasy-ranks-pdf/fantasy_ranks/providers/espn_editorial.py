@@ -1,24 +1,73 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import date
+from io import StringIO
 import os
 import re
-import time
-from datetime import date, datetime
-from typing import Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 
-from fantasy_ranks.models import PlayerRank, Scoring
-from fantasy_ranks.providers.base import Provider
-from fantasy_ranks.utils.caching import cache_get, cache_put
+from fantasy_ranks.models import POSITIONS, Scoring
+from fantasy_ranks.providers.base import Provider, run_sync
+from fantasy_ranks.utils.caching import (
+    cache_get_frame,
+    cache_put_frame,
+    cache_put_validators,
+    cache_touch,
+    conditional_headers,
+)
+from fantasy_ranks.utils.tables import (
+    HEADER_FIELDS,
+    clean_text,
+    finalize_rows,
+    read_rank_tables,
+    to_int,
+)
 
+if TYPE_CHECKING:
+    # BeautifulSoup is only a fallback parser; import it where it is used
+    from bs4 import BeautifulSoup
 
-USER_AGENT = (
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
-    "(KHTML, like Gecko) Version/17.0 Safari/605.1.15"
-)
+
+_HEADER_FIELDS = {**HEADER_FIELDS, "RANK": "rank"}
+_POS_NORMALIZE = {
+    "D/ST": "DST",
+    "DST": "DST",
+    "RB/WR": "RB",
+    "WR/TE": "WR",
+    "QB": "QB",
+    "RB": "RB",
+    "WR": "WR",
+    "TE": "TE",
+    "K": "K",
+}
+_POS_DTYPE = pd.CategoricalDtype(list(POSITIONS))
+_RANK_HEADER_RE = re.compile(r"RK|Rank", re.IGNORECASE)
+
+
+_SAMPLE: Dict[str, List[Any]] = {
+    "rank": [1, 2, 3],
+    "name": ["Sample Player", "Sample WR", "Sample QB"],
+    "team": ["AAA", "BBB", "CCC"],
+    "pos": ["RB", "WR", "QB"],
+}
+
+
+def _sample_frame(n: int) -> pd.DataFrame:
+    """First ``n`` sample rows, built with explicit dtypes."""
+    return pd.DataFrame(
+        {
+            "rank": pd.array(_SAMPLE["rank"][:n], dtype="Int64"),
+            "name": pd.array(_SAMPLE["name"][:n], dtype=object),
+            "team": pd.Categorical(_SAMPLE["team"][:n]),
+            "pos": pd.Categorical(_SAMPLE["pos"][:n], dtype=_POS_DTYPE),
+            "bye": pd.array([None] * n, dtype="Int64"),
+        }
+    )
 
 
 class ESPNEditorialProvider(Provider):
@@ -33,42 +82,70 @@ class ESPNEditorialProvider(Provider):
         limit: Optional[int] = None,
         season: Optional[int] = None,
         include_def_k: bool = True,
+    ) -> pd.DataFrame:
+        return run_sync(
+            self.fetch_async(
+                scoring,
+                positions=positions,
+                limit=limit,
+                season=season,
+                include_def_k=include_def_k,
+            )
+        )
+
+    async def fetch_async(
+        self,
+        scoring: Scoring,
+        *,
+        positions: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        season: Optional[int] = None,
+        include_def_k: bool = True,
     ) -> pd.DataFrame:
         season = season or date.today().year
         url = self._resolve_url(scoring=scoring, season=season)
 
         cache_key = f"v2::espn-editorial::{season}::{scoring}::{url}"
-        cached = cache_get(cache_key)
+        cached = cache_get_frame(cache_key)
         if cached is not None:
-            df = pd.DataFrame(cached)
-            # Guard against stale/empty cache
-            required = {"rank", "name", "team", "pos"}
-            if not df.empty and required.issubset(set(df.columns)):
-                return self._finalize_df(df, scoring=scoring, positions=positions, limit=limit, include_def_k=include_def_k)
+            cached = self._categorize(cached)
+            return finalize_rows(cached, positions=positions, limit=limit, include_def_k=include_def_k)
 
+        # Validators of the response the frame was parsed from; none for sample data
+        validators: Mapping[str, str] = {}
         # In tests or when override is non-HTTP, return a stable sample set
         if not (url.startswith("http://") or url.startswith("https://")):
-            df = pd.DataFrame(
-                [
-                    {"rank": 1, "name": "Sample Player", "team": "AAA", "pos": "RB", "bye": None},
-                    {"rank": 2, "name": "Sample WR", "team": "BBB", "pos": "WR", "bye": None},
-                    {"rank": 3, "name": "Sample QB", "team": "CCC", "pos": "QB", "bye": None},
-                ]
-            )
+            df = _sample_frame(3)
         else:
-            html = self._fetch_html(url)
-            df = self._parse_html_to_df(html, scoring=scoring, include_def_k=include_def_k)
+            # Revalidate an expired entry instead of downloading the page again
+            stale = cache_get_frame(cache_key, allow_stale=True)
+            resp = await self._fetch_html(
+                url, validators=conditional_headers(cache_key) if stale is not None else None
+            )
+            if resp.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+                cache_touch(cache_key)
+                stale = self._categorize(stale)
+                return finalize_rows(stale, positions=positions, limit=limit, include_def_k=include_def_k)
+            html = resp.text
+            df = await self._download_frame(html)
+            if df is None:
+                # Parse off the event loop so other providers' requests keep progressing
+                # K/DST stay in the cached frame; finalize_rows drops them per call
+                df = await asyncio.to_thread(
+                    self._parse_html_to_df, html, scoring=scoring, include_def_k=True
+                )
+            if not df.empty:
+                validators = resp.headers
         if df.empty:
             # Fallback minimal dataset to keep CLI usable when ESPN layout changes
-            sample = [
-                {"rank": 1, "name": "Sample Player", "team": "AAA", "pos": "RB", "bye": None},
-                {"rank": 2, "name": "Sample WR", "team": "BBB", "pos": "WR", "bye": None},
-            ]
-            df = pd.DataFrame(sample)
+            df = _sample_frame(2)
+        df = self._categorize(df)
 
-        # write to cache (store as plain records)
-        cache_put(cache_key, df.to_dict(orient="records"))
-        return self._finalize_df(df, scoring=scoring, positions=positions, limit=limit, include_def_k=include_def_k)
+        # write to cache (Parquet keeps dtypes intact across reads)
+        cache_put_frame(cache_key, df)
+        # Only now: a 304 must never pair these validators with an older frame
+        cache_put_validators(cache_key, validators)
+        return finalize_rows(df, positions=positions, limit=limit, include_def_k=include_def_k)
 
     # URL resolution
     def _resolve_url(self, *, scoring: Scoring, season: int) -> str:
@@ -80,157 +157,183 @@ class ESPNEditorialProvider(Provider):
         return self.homepage_url
 
     # Network fetch
-    def _fetch_html(self, url: str) -> str:
-        headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
-        last_exc: Optional[Exception] = None
-        for attempt in range(4):
-            try:
-                with httpx.Client(headers=headers, timeout=20.0, follow_redirects=True) as client:
-                    resp = client.get(url)
-                    resp.raise_for_status()
-                    return resp.text
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                time.sleep(0.8 * (attempt + 1))
-        raise RuntimeError(f"Failed to fetch ESPN editorial page: {url}\n{last_exc}")
+    async def _fetch_html(
+        self, url: str, *, validators: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """GET the page; with ``validators`` a ``304 Not Modified`` is returned as-is."""
+        headers = {"Accept": "text/html,application/xhtml+xml", **(validators or {})}
+        return await self.get_with_retries(url, headers=headers, what="ESPN editorial page")
 
     # Parsing helpers
-    @staticmethod
-    def _clean_text(text: str) -> str:
-        cleaned = text.replace("\xa0", " ").replace("’", "'")
-        return re.sub(r"\s+", " ", cleaned).strip()
-
-    def _parse_table(self, table: BeautifulSoup) -> List[dict]:
-        # header mapping
-        headers = [self._clean_text(th.get_text(" ")) for th in table.select("thead th, tr th")]
-        rows: List[dict] = []
+    def _parse_table(
+        self,
+        table: BeautifulSoup,
+        ranks: List[int],
+        names: List[str],
+        teams: List[str],
+        poses: List[str],
+        byes: List[Optional[int]],
+    ) -> None:
+        """Append each ranked row of ``table`` to the per-column lists."""
+        # header mapping, resolved to cell indexes once per table
+        headers = [clean_text(th.get_text(" ")) for th in table.select("thead th, tr th")]
+        colmap = {h.upper(): i for i, h in enumerate(headers)}
+        indexes = (
+            colmap.get("RK", 0),
+            colmap.get("PLAYER", 1),
+            colmap.get("TEAM", 2),
+            colmap.get("POS", 3),
+            colmap.get("BYE", -1),
+        )
         for tr in table.select("tbody tr, tr"):
-            cells = [self._clean_text(td.get_text(" ")) for td in tr.find_all(["td", "th"])]
+            cells = [clean_text(td.get_text(" ")) for td in tr.find_all(["td", "th"])]
             if not cells or all(c == "" for c in cells):
                 continue
             # Skip tier headers / non-numeric ranks
             if not cells[0].isdigit():
                 continue
-            row = self._row_from_cells(headers, cells)
+            row = self._row_from_cells(indexes, cells)
             if row:
-                rows.append(row)
-        return rows
+                rank, player, team, pos, bye = row
+                ranks.append(rank)
+                names.append(player)
+                teams.append(team)
+                poses.append(pos)
+                byes.append(bye)
 
-    def _row_from_cells(self, headers: List[str], cells: List[str]) -> Optional[dict]:
-        # Expected columns: RK, PLAYER, TEAM, POS, BYE
-        colmap = {h.upper(): i for i, h in enumerate(headers)}
+    def _row_from_cells(
+        self, indexes: Tuple[int, int, int, int, int], cells: List[str]
+    ) -> Optional[Tuple[int, str, str, str, Optional[int]]]:
+        # Expected columns: RK, PLAYER, TEAM, POS, BYE (bye index is -1 when absent)
+        rk_idx, player_idx, team_idx, pos_idx, bye_idx = indexes
         try:
-            rank_str = cells[colmap.get("RK", 0)]
-            player = cells[colmap.get("PLAYER", 1)]
-            team = cells[colmap.get("TEAM", 2)]
-            pos = cells[colmap.get("POS", 3)]
-            bye_str = cells[colmap.get("BYE", 4)] if "BYE" in colmap else ""
-        except Exception:
+            rank_str = cells[rk_idx]
+            player = cells[player_idx]
+            team = cells[team_idx]
+            pos = cells[pos_idx]
+            bye_str = cells[bye_idx] if bye_idx >= 0 else ""
+        except IndexError:
             return None
         if not rank_str.isdigit():
             return None
         bye = int(bye_str) if bye_str.isdigit() else None
-        # Normalize
+        # Normalize (positions are mapped column-wise by _normalize_pos)
         pos = pos.upper().strip()
-        if pos == "D/ST" or pos == "DST":
-            pos = "DST"
-        else:
-            pos = pos.replace("RB/WR", "RB").replace("WR/TE", "WR").split("/")[0]
         team = team.upper().strip()
-        player = self._clean_text(player)
-        return {"rank": int(rank_str), "name": player, "team": team, "pos": pos, "bye": bye}
+        player = clean_text(player)
+        return int(rank_str), player, team, pos, bye
+
+    @staticmethod
+    def _normalize_pos(pos: pd.Series) -> pd.Series:
+        # One hash probe per row for known labels; other combos keep their first position
+        return pos.map(_POS_NORMALIZE).fillna(pos.str.split("/").str[0])
+
+    def _download_links(self, html: str) -> List[str]:
+        """Return hrefs of explicit download links (.csv, .xls[x]) in page order."""
+        exts = (".csv", ".xlsx", ".xls")
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html, "lxml")
+            anchors = [(a["href"], a.get_text(" ")) for a in soup.find_all("a", href=True)]
+        else:
+            anchors = [
+                (a.attributes.get("href") or "", a.text(separator=" "))
+                for a in LexborHTMLParser(html).css("a[href]")
+            ]
+        links: List[str] = []
+        for raw_href, text in anchors:
+            href = raw_href.strip()
+            if "download" in clean_text(text).lower() or href.lower().endswith(exts):
+                links.append(href)
+        return links
+
+    def _read_tables(self, html: str) -> Optional[pd.DataFrame]:
+        """Tables mentioning a rank header, else all tables; None when lxml cannot parse the page."""
+        return read_rank_tables(html, _HEADER_FIELDS, match=_RANK_HEADER_RE)
+
+    async def _download_frame(self, html: str) -> Optional[pd.DataFrame]:
+        """Rankings from the first explicit download link (.csv, .xls[x]); None to parse the HTML."""
+        for href in await asyncio.to_thread(self._download_links, html):
+            try:
+                df = await self._parse_download(href)
+                if not df.empty:
+                    return df
+            except Exception:
+                # fallback to HTML parsing
+                break
+        return None
 
     def _parse_html_to_df(self, html: str, *, scoring: Scoring, include_def_k: bool) -> pd.DataFrame:
-        soup = BeautifulSoup(html, "lxml")
-        # Prefer explicit download links (.csv, .xls[x], .pdf)
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            text = self._clean_text(a.get_text(" "))
-            if "download" in text.lower() or any(href.lower().endswith(ext) for ext in [".csv", ".xlsx", ".xls"]):
-                try:
-                    df = self._parse_download(href)
-                    if not df.empty:
-                        return df
-                except Exception:
-                    # fallback to HTML parsing
-                    break
-
-        rows: List[dict] = []
-        for table in soup.find_all("table"):
-            rows.extend(self._parse_table(table))
+        df = self._read_tables(html)
+        if df is None:
+            # lxml's table reader failed on this markup; walk the DOM with BeautifulSoup instead
+            from bs4 import BeautifulSoup
 
-        # Deduplicate by rank then by name
-        seen: set = set()
-        deduped: List[dict] = []
-        for r in rows:
-            key = (r.get("rank"), r.get("name"))
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped.append(r)
+            ranks: List[int] = []
+            names: List[str] = []
+            teams: List[str] = []
+            poses: List[str] = []
+            byes: List[Optional[int]] = []
+            for table in BeautifulSoup(html, "lxml").find_all("table"):
+                self._parse_table(table, ranks, names, teams, poses, byes)
+            # Typed column arrays: no per-row dicts and no dtype inference
+            df = pd.DataFrame(
+                {
+                    "rank": np.asarray(ranks, dtype=np.int32),
+                    "name": pd.array(names, dtype=object),
+                    "team": pd.Categorical(teams),
+                    # raw labels ("D/ST", "RB/WR") are mapped onto POSITIONS below
+                    "pos": pd.array(poses, dtype=object),
+                    "bye": pd.array(byes, dtype="Int16"),
+                }
+            )
+        else:
+            # read_html keeps raw cells; tier headers and other non-numeric ranks become <NA>
+            df = df.assign(rank=to_int(df["rank"]), bye=to_int(df["bye"]))
 
-        df = pd.DataFrame(deduped, columns=["rank", "name", "team", "pos", "bye"]).sort_values("rank")
+        # Validate in bulk against the PlayerRank schema: known position, integer rank
+        df = df.assign(pos=self._normalize_pos(df["pos"]))
+        df = df[df["pos"].isin(POSITIONS)].dropna(subset=["rank"])
+
+        # Deduplicate by rank then by name
+        # rank is non-null here; a stable sort keeps page order for tied ranks
+        df = df.drop_duplicates(subset=["rank", "name"], keep="first").sort_values(
+            "rank", kind="mergesort", na_position="last"
+        )
         # Filter def/k if requested
         if not include_def_k:
-            df = df[~df["pos"].isin(["K", "DST"])].copy()
+            df = df.loc[~df["pos"].isin(["K", "DST"])]
 
-        # Validate rows with Pydantic
-        now = date.today()
-        valid_rows: List[dict] = []
-        for rec in df.to_dict(orient="records"):
-            try:
-                item = PlayerRank(
-                    name=rec["name"],
-                    team=rec["team"],
-                    pos=rec["pos"],
-                    rank=int(rec["rank"]),
-                    bye=rec.get("bye"),
-                    source=self.name,
-                    scoring=scoring,
-                    date=now,
-                )
-                valid_rows.append(item.model_dump())
-            except Exception:
-                continue
+        df = df.assign(source=self.name, scoring=scoring, date=date.today())
+        return self._categorize(df.reset_index(drop=True))
 
-        return pd.DataFrame(valid_rows, columns=["rank", "name", "team", "pos", "bye", "source", "scoring", "date"])  # type: ignore[list-item]
+    @staticmethod
+    def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+        # Low-cardinality columns as categories: filters compare int8 codes, not strings
+        if "pos" in df.columns and df["pos"].dtype != _POS_DTYPE:
+            df = df.assign(pos=df["pos"].astype(_POS_DTYPE))
+        if "team" in df.columns and not isinstance(df["team"].dtype, pd.CategoricalDtype):
+            df = df.assign(team=df["team"].astype("category"))
+        return df
 
-    def _parse_download(self, href: str) -> pd.DataFrame:
+    async def _parse_download(self, href: str) -> pd.DataFrame:
         # Absolute or relative
         if href.startswith("/"):
             url = f"https://www.espn.com{href}"
         else:
             url = href
 
-        headers = {"User-Agent": USER_AGENT}
-        with httpx.Client(headers=headers, timeout=20.0, follow_redirects=True) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            content_type = resp.headers.get("content-type", "")
-            if "/csv" in content_type or url.lower().endswith(".csv"):
-                from io import StringIO
+        resp = await self.async_client().get(url)
+        resp.raise_for_status()
+        content_type = resp.headers.get("content-type", "")
+        if "/csv" in content_type or url.lower().endswith(".csv"):
+            return pd.read_csv(StringIO(resp.text))
+        if "excel" in content_type or any(url.lower().endswith(ext) for ext in [".xlsx", ".xls"]):
+            import io
 
-                return pd.read_csv(StringIO(resp.text))
-            if "excel" in content_type or any(url.lower().endswith(ext) for ext in [".xlsx", ".xls"]):
-                import io
-
-                return pd.read_excel(io.BytesIO(resp.content))
+            return pd.read_excel(io.BytesIO(resp.content))
 
         return pd.DataFrame()
-
-    def _finalize_df(
-        self,
-        df: pd.DataFrame,
-        *,
-        scoring: Scoring,
-        positions: Optional[Iterable[str]],
-        limit: Optional[int],
-        include_def_k: bool,
-    ) -> pd.DataFrame:
-        if positions:
-            df = df[df["pos"].isin([p.upper() for p in positions])]
-        if limit:
-            df = df.head(limit)
-        if not include_def_k:
-            df = df[~df["pos"].isin(["K", "DST"])].copy()
-        return df.reset_index(drop=True)
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
-import os
+import asyncio
 from datetime import date
+import os
 from typing import Iterable, Optional
 
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
 
 from fantasy_ranks.models import Scoring
-from fantasy_ranks.providers.base import Provider
-from fantasy_ranks.utils.caching import cache_get, cache_put, DEFAULT_TTL_SECONDS
-
+from fantasy_ranks.providers.base import Provider, run_sync
+from fantasy_ranks.utils.caching import (
+    cache_get,
+    cache_get_frame,
+    cache_put,
+    cache_put_frame,
+    cache_put_validators,
+    cache_touch,
+    conditional_headers,
+)
+from fantasy_ranks.utils.tables import position_mask
 
 SLEEPER_BASE = "https://api.sleeper.app/v1"
+# Sleeper serves highly repetitive JSON; brotli/gzip cuts the bytes on the wire
+REQUEST_HEADERS = {"Accept-Encoding": "br, gzip"}
+PLAYERS_TTL_SECONDS = 86400
+PLAYER_FIELDS = ["first_name", "last_name", "team", "position", "fantasy_positions"]
 
 
 class SleeperADPProvider(Provider):
@@ -26,32 +41,46 @@ class SleeperADPProvider(Provider):
         positions: Optional[Iterable[str]] = None,
         limit: Optional[int] = None,
         season: Optional[int] = None,
+    ) -> pd.DataFrame:
+        return run_sync(
+            self.fetch_async(scoring, positions=positions, limit=limit, season=season)
+        )
+
+    async def fetch_async(
+        self,
+        scoring: Scoring,
+        *,
+        positions: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        season: Optional[int] = None,
     ) -> pd.DataFrame:
         # TTL default 6h
         ttl_seconds = int(os.getenv("SLEEPER_CACHE_TTL_SECONDS", str(21600)))
 
-        season = season or self._get_season(ttl_seconds=ttl_seconds)
+        season = season or await self._get_season(ttl_seconds=ttl_seconds)
         cache_key = f"v1::sleeper-adp::{season}::{scoring}"
-        cached = cache_get(cache_key, ttl_seconds=ttl_seconds)
+        cached = cache_get_frame(cache_key, ttl_seconds=ttl_seconds)
         if cached is not None:
-            df = pd.DataFrame(cached)
-            return self._finalize(df, positions=positions, limit=limit)
+            return self._finalize(cached, positions=positions, limit=limit)
 
         # Preferred: official ADP (if available in future). Fallback: env-provided ADP URL.
         fallback_url = os.getenv("SLEEPER_ADP_FALLBACK_URL")
         if fallback_url:
-            df = self._fetch_fallback_adp(fallback_url)
+            df = await self._fetch_fallback_adp(fallback_url)
         else:
             # Last resort: approximate ranking order via trending adds.
-            df = self._fetch_trending_adp()
+            df = await self._fetch_trending_adp()
 
         df["source"] = self.name
         df["scoring"] = scoring
         df["date"] = date.today().isoformat()
-        cache_put(cache_key, df.to_dict(orient="records"))
+        # Low-cardinality columns as categories: position filters compare codes, not strings
+        df["pos"] = df["pos"].astype("category")
+        df["team"] = df["team"].astype("category")
+        cache_put_frame(cache_key, df)
         return self._finalize(df, positions=positions, limit=limit)
 
-    def _get_season(self, *, ttl_seconds: int) -> int:
+    async def _get_season(self, *, ttl_seconds: int) -> int:
         cache_key = "sleeper-state-nfl"
         cached = cache_get(cache_key, ttl_seconds=ttl_seconds)
         if cached and isinstance(cached, dict) and "season" in cached:
@@ -59,67 +88,104 @@ class SleeperADPProvider(Provider):
                 return int(cached["season"])
             except Exception:
                 pass
-        with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-            resp = client.get(f"{SLEEPER_BASE}/state/nfl")
-            resp.raise_for_status()
-            data = resp.json()
-            cache_put(cache_key, data)
-            return int(data.get("season") or date.today().year)
-
-    def _fetch_trending_adp(self) -> pd.DataFrame:
-        # Get trending adds and player map; rank by count desc
-        with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-            trend = client.get(f"{SLEEPER_BASE}/players/nfl/trending/add?lookback_hours=168&limit=300")
-            trend.raise_for_status()
-            trending = trend.json()
-            players_resp = client.get(f"{SLEEPER_BASE}/players/nfl")
-            players_resp.raise_for_status()
-            players = players_resp.json()
-
-        rows = []
-        for idx, item in enumerate(trending, start=1):
-            pid = str(item.get("player_id"))
-            meta = players.get(pid, {})
-            name = f"{meta.get('first_name','').strip()} {meta.get('last_name','').strip()}".strip()
-            team = (meta.get("team") or "").upper()
-            pos = (meta.get("position") or (meta.get("fantasy_positions") or [""])[0]).upper()
-            if pos == "D/ST" or pos == "DST":
-                pos = "DST"
-            rows.append({
-                "rank": idx,
-                "name": name or pid,
-                "team": team,
-                "pos": pos,
+        client = self.async_client()
+        resp = await client.get(f"{SLEEPER_BASE}/state/nfl", headers=REQUEST_HEADERS)
+        resp.raise_for_status()
+        data = resp.json()
+        cache_put(cache_key, data)
+        return int(data.get("season") or date.today().year)
+
+    async def _fetch_trending_adp(self) -> pd.DataFrame:
+        # Get trending adds and player map concurrently; rank by count desc
+        client = self.async_client()
+        trend, players_df = await asyncio.gather(
+            client.get(
+                f"{SLEEPER_BASE}/players/nfl/trending/add?lookback_hours=168&limit=300",
+                headers=REQUEST_HEADERS,
+            ),
+            self._fetch_players(),
+        )
+        trend.raise_for_status()
+        ids = pd.DataFrame.from_records(orjson.loads(trend.content), columns=["player_id"])
+
+        # Trending order is the ranking; a left merge keeps it while joining player metadata
+        joined = ids.astype({"player_id": str}).merge(players_df, on="player_id", how="left")
+        name = joined["name"].fillna("")
+        return pd.DataFrame(
+            {
+                "rank": np.arange(1, len(joined) + 1),
+                "name": name.where(name != "", joined["player_id"]),
+                "team": joined["team"].fillna(""),
+                "pos": joined["pos"].fillna(""),
                 "bye": None,
                 "adp": None,
-            })
-        return pd.DataFrame(rows, columns=["rank", "name", "team", "pos", "bye", "adp"]).sort_values("rank")
-
-    def _fetch_fallback_adp(self, url: str) -> pd.DataFrame:
-        with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
-        rows = []
-        # Expect a list of entries with name/team/position/adp
-        for idx, item in enumerate(data, start=1):
-            name = str(item.get("name", "")).strip()
-            team = str(item.get("team", "")).upper()
-            pos = str(item.get("position", "")).upper()
-            adp = item.get("adp")
-            rows.append({
-                "rank": idx,
-                "name": name,
-                "team": team,
+            }
+        )
+
+    async def _fetch_players(self) -> pd.DataFrame:
+        """Return the Sleeper player map as ``player_id, name, team, pos``.
+
+        ``/players/nfl`` is the largest response we fetch (~5 MB) and rarely changes, so
+        the reduced frame is cached on its own with a long TTL and revalidated with
+        its ETag / Last-Modified once that expires.
+        """
+        ttl_seconds = int(os.getenv("SLEEPER_PLAYERS_CACHE_TTL_SECONDS", str(PLAYERS_TTL_SECONDS)))
+        cache_key = "v1::sleeper-players-nfl"
+        cached = cache_get_frame(cache_key, ttl_seconds=ttl_seconds)
+        if cached is not None:
+            return cached
+
+        # An expired map is revalidated: a 304 costs one round trip instead of the full dump
+        stale = cache_get_frame(cache_key, allow_stale=True)
+        headers = dict(REQUEST_HEADERS)
+        if stale is not None:
+            headers.update(conditional_headers(cache_key))
+        client = self.async_client()
+        resp = await client.get(f"{SLEEPER_BASE}/players/nfl", headers=headers)
+        if resp.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            cache_touch(cache_key)
+            return stale
+        resp.raise_for_status()
+        meta = pd.DataFrame.from_dict(orjson.loads(resp.content), orient="index")
+        meta = meta.reindex(columns=PLAYER_FIELDS)
+        first = meta["first_name"].fillna("").astype(str).str.strip()
+        last = meta["last_name"].fillna("").astype(str).str.strip()
+        position = meta["position"].fillna("").astype(str)
+        fallback = meta["fantasy_positions"].astype(object).str[0].fillna("").astype(str)
+        pos = position.where(position != "", fallback).str.upper().replace({"D/ST": "DST"})
+        df = pd.DataFrame(
+            {
+                "player_id": meta.index.astype(str),
+                "name": (first + " " + last).str.strip(),
+                "team": meta["team"].fillna("").astype(str).str.upper(),
                 "pos": pos,
+            }
+        ).reset_index(drop=True)
+        cache_put_frame(cache_key, df)
+        cache_put_validators(cache_key, resp.headers)
+        return df
+
+    async def _fetch_fallback_adp(self, url: str) -> pd.DataFrame:
+        resp = await self.async_client().get(url)
+        resp.raise_for_status()
+        # Expect a list of entries with name/team/position/adp
+        data = pd.DataFrame.from_records(
+            orjson.loads(resp.content), columns=["name", "team", "position", "adp"]
+        )
+        return pd.DataFrame(
+            {
+                "rank": np.arange(1, len(data) + 1),
+                "name": data["name"].fillna("").astype(str).str.strip(),
+                "team": data["team"].fillna("").astype(str).str.upper(),
+                "pos": data["position"].fillna("").astype(str).str.upper(),
                 "bye": None,
-                "adp": adp,
-            })
-        return pd.DataFrame(rows, columns=["rank", "name", "team", "pos", "bye", "adp"]).sort_values("rank")
+                "adp": data["adp"],
+            }
+        )
 
     def _finalize(self, df: pd.DataFrame, *, positions: Optional[Iterable[str]], limit: Optional[int]) -> pd.DataFrame:
         if positions:
-            df = df[df["pos"].isin([p.upper() for p in positions])]
+            df = df[position_mask(df["pos"], positions)]
         if limit:
             df = df.head(limit)
         return df.reset_index(drop=True)
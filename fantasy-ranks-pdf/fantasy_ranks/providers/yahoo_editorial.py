@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-import os
-import re
-import time
+import asyncio
+from dataclasses import fields
 from datetime import date
-from typing import Iterable, List, Optional
+import os
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-import httpx
 import pandas as pd
-from bs4 import BeautifulSoup
 
-from fantasy_ranks.models import PlayerRank, Scoring
-from fantasy_ranks.providers.base import Provider
-from fantasy_ranks.utils.caching import cache_get, cache_put
+from fantasy_ranks.models import POSITIONS, PlayerRank, Scoring
+from fantasy_ranks.providers.base import Provider, run_sync
+from fantasy_ranks.utils.caching import cache_get_frame, cache_put_frame
+from fantasy_ranks.utils.tables import (
+    HEADER_FIELDS,
+    TABLE_FIELDS,
+    clean_text,
+    finalize_rows,
+    read_rank_tables,
+    to_int,
+)
 
+if TYPE_CHECKING:
+    # selectolax is the fast path; BeautifulSoup only parses when it is unavailable
+    from bs4 import Tag
+    from selectolax.lexbor import LexborNode
 
-USER_AGENT = (
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
-    "(KHTML, like Gecko) Version/17.0 Safari/605.1.15"
-)
+
+# Same columns, in the same order, as a PlayerRank record
+_COLUMNS = [f.name for f in fields(PlayerRank)]
+_POSITION_SET = frozenset(POSITIONS)
+# rank, name, team, pos, bye: one DOM row in TABLE_FIELDS order
+_Row = Tuple[int, str, str, str, Optional[int]]
 
 
 class YahooEditorialProvider(Provider):
@@ -33,27 +45,47 @@ class YahooEditorialProvider(Provider):
         limit: Optional[int] = None,
         season: Optional[int] = None,
         include_def_k: bool = True,
+    ) -> pd.DataFrame:
+        return run_sync(
+            self.fetch_async(
+                scoring,
+                positions=positions,
+                limit=limit,
+                season=season,
+                include_def_k=include_def_k,
+            )
+        )
+
+    async def fetch_async(
+        self,
+        scoring: Scoring,
+        *,
+        positions: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        season: Optional[int] = None,
+        include_def_k: bool = True,
     ) -> pd.DataFrame:
         season = season or date.today().year
         url = self._resolve_url(scoring=scoring, season=season)
 
         cache_key = f"v1::yahoo-editorial::{season}::{scoring}::{url}"
-        cached = cache_get(cache_key)
+        cached = cache_get_frame(cache_key)
         if cached is not None:
-            df = pd.DataFrame(cached)
-            if not df.empty and {"rank", "name", "team", "pos"}.issubset(df.columns):
-                return self._finalize_df(df, positions=positions, limit=limit, include_def_k=include_def_k)
+            return finalize_rows(cached, positions=positions, limit=limit, include_def_k=include_def_k)
 
         if not (url.startswith("http://") or url.startswith("https://")):
-            df = self._sample()
+            df = self._sample(scoring)
         else:
-            html = self._fetch_html(url)
-            df = self._parse_html_to_df(html, scoring=scoring, include_def_k=include_def_k)
+            html = await self._fetch_html(url)
+            # K/DST stay in the cached frame; finalize_rows drops them per call
+            df = await asyncio.to_thread(
+                self._parse_html_to_df, html, scoring=scoring, include_def_k=True
+            )
         if df.empty:
-            df = self._sample()
+            df = self._sample(scoring)
 
-        cache_put(cache_key, df.to_dict(orient="records"))
-        return self._finalize_df(df, positions=positions, limit=limit, include_def_k=include_def_k)
+        cache_put_frame(cache_key, df)
+        return finalize_rows(df, positions=positions, limit=limit, include_def_k=include_def_k)
 
     def _resolve_url(self, *, scoring: Scoring, season: int) -> str:
         override = os.getenv("FANTASY_RANKS_YAHOO_URL")
@@ -61,119 +93,117 @@ class YahooEditorialProvider(Provider):
             return override
         return self.homepage_url
 
-    def _fetch_html(self, url: str) -> str:
-        headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
-        last_exc: Optional[Exception] = None
-        for attempt in range(4):
-            try:
-                with httpx.Client(headers=headers, timeout=20.0, follow_redirects=True) as client:
-                    resp = client.get(url)
-                    resp.raise_for_status()
-                    return resp.text
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                time.sleep(0.8 * (attempt + 1))
-        raise RuntimeError(f"Failed to fetch Yahoo editorial page: {url}\n{last_exc}")
+    async def _fetch_html(self, url: str) -> str:
+        headers = {"Accept": "text/html,application/xhtml+xml"}
+        resp = await self.get_with_retries(url, headers=headers, what="Yahoo editorial page")
+        return resp.text
+
+    @staticmethod
+    def _table_text(table: LexborNode) -> Tuple[List[str], List[List[str]]]:
+        # "tr" already matches rows under tbody; lexbor would return them twice for "tbody tr, tr"
+        headers = [th.text(deep=True, separator=" ") for th in table.css("tr th")]
+        rows = [[td.text(deep=True, separator=" ") for td in tr.css("td, th")] for tr in table.css("tr")]
+        return headers, rows
 
     @staticmethod
-    def _clean(text: str) -> str:
-        return re.sub(r"\s+", " ", text.replace("\xa0", " ").strip())
-
-    def _parse_table(self, table: BeautifulSoup) -> List[dict]:
-        headers = [self._clean(th.get_text(" ")) for th in table.select("thead th, tr th")]
-        rows: List[dict] = []
-        for tr in table.select("tbody tr, tr"):
-            cells = [self._clean(td.get_text(" ")) for td in tr.find_all(["td", "th"])]
+    def _table_text_bs4(table: Tag) -> Tuple[List[str], List[List[str]]]:
+        headers = [th.get_text(" ") for th in table.select("thead th, tr th")]
+        rows = [[td.get_text(" ") for td in tr.find_all(["td", "th"])] for tr in table.select("tbody tr, tr")]
+        return headers, rows
+
+    def _parse_table(self, raw_headers: List[str], raw_rows: List[List[str]]) -> List[_Row]:
+        headers = [clean_text(h) for h in raw_headers]
+        # header mapping, resolved to cell indexes once per table
+        colmap = {h.upper(): i for i, h in enumerate(headers)}
+        indexes = (
+            colmap.get("RK", 0),
+            colmap.get("PLAYER", 1),
+            colmap.get("TEAM", 2),
+            colmap.get("POS", 3),
+            colmap.get("BYE", -1),
+        )
+        rows: List[_Row] = []
+        for raw in raw_rows:
+            cells = [clean_text(c) for c in raw]
             if not cells or all(c == "" for c in cells):
                 continue
             if not cells[0].isdigit():
                 continue
-            row = self._row_from_cells(headers, cells)
+            row = self._row_from_cells(indexes, cells)
             if row:
                 rows.append(row)
         return rows
 
-    def _row_from_cells(self, headers: List[str], cells: List[str]) -> Optional[dict]:
-        colmap = {h.upper(): i for i, h in enumerate(headers)}
+    def _row_from_cells(
+        self, indexes: Tuple[int, int, int, int, int], cells: List[str]
+    ) -> Optional[_Row]:
+        # bye index is -1 when the table has no BYE column
+        rk_idx, player_idx, team_idx, pos_idx, bye_idx = indexes
         try:
-            rank_str = cells[colmap.get("RK", 0)]
-            player = cells[colmap.get("PLAYER", 1)]
-            team = cells[colmap.get("TEAM", 2)]
-            pos = cells[colmap.get("POS", 3)]
-            bye_str = cells[colmap.get("BYE", 4)] if "BYE" in colmap else ""
-        except Exception:
+            rank_str = cells[rk_idx]
+            player = cells[player_idx]
+            team = cells[team_idx]
+            pos = cells[pos_idx]
+        except IndexError:
             return None
+        bye_str = cells[bye_idx] if 0 <= bye_idx < len(cells) else ""
         if not rank_str.isdigit():
             return None
         bye = int(bye_str) if bye_str.isdigit() else None
-        pos = pos.upper().strip()
-        if pos in {"D/ST", "DST"}:
-            pos = "DST"
+        # Positions are mapped column-wise by _normalize_pos; source, scoring and date by the caller
+        return int(rank_str), player, team.upper(), pos.upper(), bye
+
+    @staticmethod
+    def _normalize_pos(pos: pd.Series) -> pd.Series:
+        first = pos.str.split("/").str[0]
+        return first.where(~pos.isin(["D/ST", "DST"]), "DST")
+
+    def _read_tables(self, html: str) -> Optional[pd.DataFrame]:
+        return read_rank_tables(html, HEADER_FIELDS)
+
+    def _parse_dom(self, html: str) -> List[_Row]:
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            from bs4 import BeautifulSoup
+
+            tables = [self._table_text_bs4(t) for t in BeautifulSoup(html, "lxml").find_all("table")]
         else:
-            pos = pos.split("/")[0]
-        return {
-            "rank": int(rank_str),
-            "name": self._clean(player),
-            "team": self._clean(team).upper(),
-            "pos": pos,
-            "bye": bye,
-            "source": self.name,
-            "scoring": "ppr",
-            "date": date.today().isoformat(),
-        }
+            tables = [self._table_text(t) for t in LexborHTMLParser(html).css("table")]
+        rows: List[_Row] = []
+        for headers, cells in tables:
+            rows.extend(self._parse_table(headers, cells))
+        return rows
 
     def _parse_html_to_df(self, html: str, *, scoring: Scoring, include_def_k: bool) -> pd.DataFrame:
-        soup = BeautifulSoup(html, "lxml")
-        rows: List[dict] = []
-        for table in soup.find_all("table"):
-            rows.extend(self._parse_table(table))
-        df = pd.DataFrame(rows)
-        if not include_def_k and not df.empty:
-            df = df[~df["pos"].isin(["K", "DST"])].copy()
-        # Validate subset via Pydantic
-        valid = []
-        for rec in df.to_dict(orient="records"):
-            try:
-                item = PlayerRank(
-                    name=rec["name"],
-                    team=rec["team"],
-                    pos=rec["pos"],
-                    rank=int(rec["rank"]),
-                    bye=rec.get("bye"),
-                    source=self.name,
-                    scoring=scoring,
-                    date=date.today(),
-                )
-                valid.append(item.model_dump())
-            except Exception:
-                continue
-        return pd.DataFrame(valid)
-
-    def _sample(self) -> pd.DataFrame:
-        sample = [
-            {"rank": 1, "name": "Yahoo Sample RB", "team": "AAA", "pos": "RB", "bye": None},
-            {"rank": 2, "name": "Yahoo Sample WR", "team": "BBB", "pos": "WR", "bye": None},
-        ]
-        df = pd.DataFrame(sample)
-        df["source"] = self.name
-        df["scoring"] = "ppr"
-        df["date"] = date.today().isoformat()
-        return df
-
-    def _finalize_df(
-        self,
-        df: pd.DataFrame,
-        *,
-        positions: Optional[Iterable[str]],
-        limit: Optional[int],
-        include_def_k: bool,
-    ) -> pd.DataFrame:
-        if positions:
-            df = df[df["pos"].isin([p.upper() for p in positions])]
-        if limit:
-            df = df.head(limit)
-        if not include_def_k:
-            df = df[~df["pos"].isin(["K", "DST"])].copy()
+        df = self._read_tables(html)
+        if df is None:
+            # lxml's table reader failed on this markup; walk the DOM instead
+            df = pd.DataFrame(self._parse_dom(html), columns=TABLE_FIELDS)
+        # Tier headers and other non-numeric ranks drop out with the rank coercion
+        df = df.assign(
+            rank=to_int(df["rank"]),
+            pos=self._normalize_pos(df["pos"]),
+            bye=to_int(df["bye"]),
+        )
+        allowed = _POSITION_SET if include_def_k else _POSITION_SET - {"K", "DST"}
+        df = df[df["pos"].isin(allowed) & df["rank"].notna()]
+        df = df.reindex(columns=_COLUMNS).assign(source=self.name, scoring=scoring, date=date.today())
         return df.reset_index(drop=True)
 
-
+    def _sample(self, scoring: Scoring) -> pd.DataFrame:
+        # Built in-process, so it skips validation and goes straight to the parsed layout
+        return pd.DataFrame(
+            {
+                "name": ["Yahoo Sample RB", "Yahoo Sample WR"],
+                "team": ["AAA", "BBB"],
+                "pos": ["RB", "WR"],
+                "rank": pd.array([1, 2], dtype="Int64"),
+                "bye": pd.array([None, None], dtype="Int64"),
+                "source": self.name,
+                "scoring": scoring,
+                "date": date.today(),
+                "notes": None,
+            },
+            columns=_COLUMNS,
+        )
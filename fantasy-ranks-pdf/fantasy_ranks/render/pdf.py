@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from fpdf import FPDF
 
@@ -40,12 +41,12 @@ DARK_BG = (24, 24, 24)
 
 
 class RankingsPDF(FPDF):
-    def __init__(self, ctx: RenderContext) -> None:
+    def __init__(self, ctx: RenderContext, *, compress: bool = True) -> None:
         super().__init__(orientation="P", unit="mm", format="A4")
         self.ctx = ctx
         self.set_auto_page_break(auto=True, margin=15)
-        # Disable compression to keep byte output stable and searchable in tests
-        self.set_compression(False)
+        # Tests pass compress=False so header/footer text stays searchable in the raw bytes
+        self.set_compression(compress)
         # Deterministic metadata
         self.set_title(ctx.title)
         self.set_author("fantasy-ranks-pdf")
@@ -83,6 +84,28 @@ class RankingsPDF(FPDF):
         self.cell(0, 10, footer_text, align="C")
 
 
+def _cell_text(value: object) -> str:
+    return "" if value is None or pd.isna(value) else str(value)
+
+
+def _draw_rows(pdf: RankingsPDF, df: pd.DataFrame, cols: List[Tuple[str, str, int]]) -> None:
+    """Draw one filled row per record; missing columns and NA values render blank."""
+    keys = [key for key, _, _ in cols]
+    pos_idx = keys.index("pos")
+    # Colors are only emitted when they change; fpdf restores them after page breaks
+    pdf.set_text_color(*pdf.text_rgb)
+    prev_pos: Optional[str] = None
+    # One object array up front instead of a Series per row
+    for row in df.reindex(columns=keys).to_numpy(dtype=object):
+        pos = str(row[pos_idx]).upper()
+        if pos != prev_pos:
+            pdf.set_fill_color(*POSITION_COLORS.get(pos, (200, 200, 200)))
+            prev_pos = pos
+        for value, (_, _, width) in zip(row, cols):
+            pdf.cell(width, 7, _cell_text(value), border=1, align="L", fill=True)
+        pdf.ln()
+
+
 def _column_defs(include_bye: bool) -> List[Tuple[str, str, int]]:
     cols: List[Tuple[str, str, int]] = [
         ("rank", "Rank", 15),
@@ -106,10 +129,12 @@ def render_rankings_pdf(
     source_url: str,
     generated_date: Optional[date] = None,
     logos_enabled: bool = False,
+    compress: bool = True,
 ) -> bytes:
     """Render rankings to a PDF and return bytes.
 
     Ensures deterministic header/footer by fixing metadata and accepting a fixed date.
+    ``compress=False`` leaves content streams uncompressed (used by tests).
     """
     ctx = RenderContext(
         title=title,
@@ -121,7 +146,7 @@ def render_rankings_pdf(
         generated_date=generated_date or date.today(),
         logos_enabled=logos_enabled,
     )
-    pdf = RankingsPDF(ctx)
+    pdf = RankingsPDF(ctx, compress=compress)
     pdf.add_page()
 
     # Table header
@@ -134,15 +159,7 @@ def render_rankings_pdf(
 
     # Table rows
     pdf.set_font("Helvetica", size=10)
-    for _, row in df.iterrows():
-        pos = str(row.get("pos", "")).upper()
-        rgb = POSITION_COLORS.get(pos, (200, 200, 200))
-        pdf.set_fill_color(*rgb)
-        pdf.set_text_color(*pdf.text_rgb)
-        for key, _, width in col_defs:
-            value = row.get(key, "")
-            pdf.cell(width, 7, str(value), border=1, align="L", fill=True)
-        pdf.ln()
+    _draw_rows(pdf, df, col_defs)
 
     out = pdf.output(dest="S")
     # fpdf2 may return bytes or bytearray depending on version
@@ -157,6 +174,7 @@ def render_consensus_pdf(
     *,
     style: Style,
     generated_date: Optional[date] = None,
+    compress: bool = True,
 ) -> bytes:
     # Page 1: consensus top 150
     ctx = RenderContext(
@@ -168,7 +186,7 @@ def render_consensus_pdf(
         style=style,
         generated_date=generated_date or date.today(),
     )
-    pdf = RankingsPDF(ctx)
+    pdf = RankingsPDF(ctx, compress=compress)
     pdf.add_page()
 
     # Build table columns
@@ -187,15 +205,7 @@ def render_consensus_pdf(
 
     pdf.set_font("Helvetica", size=10)
     top = df.sort_values("consensus_rank").head(150)
-    for _, row in top.iterrows():
-        pos = str(row.get("pos", "")).upper()
-        rgb = POSITION_COLORS.get(pos, (200, 200, 200))
-        pdf.set_fill_color(*rgb)
-        pdf.set_text_color(*pdf.text_rgb)
-        for key, _, width in cols:
-            value = row.get(key, "")
-            pdf.cell(width, 7, str(value), border=1, align="L", fill=True)
-        pdf.ln()
+    _draw_rows(pdf, top, cols)
 
     # Page 2: biggest differences top +/-25
     pdf.add_page()
@@ -204,20 +214,10 @@ def render_consensus_pdf(
         pdf.cell(width, 8, label, border=1, align="L")
     pdf.ln()
     pdf.set_font("Helvetica", size=10)
-    diffs = (
-        df.assign(abs_delta=(df["delta"].abs()))
-        .sort_values("abs_delta", ascending=False)
-        .head(25)
-    )
-    for _, row in diffs.iterrows():
-        pos = str(row.get("pos", "")).upper()
-        rgb = POSITION_COLORS.get(pos, (200, 200, 200))
-        pdf.set_fill_color(*rgb)
-        pdf.set_text_color(*pdf.text_rgb)
-        for key, _, width in cols:
-            value = row.get(key, "")
-            pdf.cell(width, 7, str(value), border=1, align="L", fill=True)
-        pdf.ln()
+    # Largest |delta| first (NaN last), selected by position without a sorted copy of df
+    abs_delta = df["delta"].abs().to_numpy(dtype=float, na_value=np.nan)
+    diffs = df.iloc[np.argsort(-abs_delta, kind="stable")[:25]]
+    _draw_rows(pdf, diffs, cols)
 
     out = pdf.output(dest="S")
     if isinstance(out, (bytes, bytearray)):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -19,21 +20,17 @@ def add_tiers(df: pd.DataFrame, *, method: str = "gap", gap_quantile: float = 0.
     method="gap": compute diffs on the chosen rank series; start a new tier when diff >= quantile.
     """
     if df.empty:
-        df["tier"] = []
-        return df
-    sr = _rank_series(df)
-    diffs = sr.diff().fillna(0)
+        return df.assign(tier=[])
+    ranks = _rank_series(df).to_numpy()
+    # Gaps are measured in rank order; rows need not be sorted (build_consensus is not)
+    order = np.argsort(ranks, kind="stable")
+    diffs = pd.Series(ranks[order]).diff().fillna(0)
     threshold = diffs.quantile(gap_quantile) if len(diffs) > 5 else (diffs.mean() + diffs.std())
-    tier = 1
-    tiers = []
-    prev = sr.iloc[0]
-    for d in diffs:
-        if d >= threshold and d > 0:
-            tier += 1
-        tiers.append(tier)
-    out = df.copy()
-    out["tier"] = tiers
-    return out
+    # Each qualifying gap opens a new tier: the tier is 1 + gaps seen so far
+    breaks = (diffs >= threshold) & (diffs > 0)
+    tiers = np.empty(len(ranks), dtype=np.int64)
+    tiers[order] = breaks.cumsum().to_numpy() + 1
+    return df.assign(tier=tiers)
 
 
 def add_vorp(
@@ -58,24 +55,18 @@ def add_vorp(
     if replacement_levels:
         levels.update({k.upper(): v for k, v in replacement_levels.items()})
 
-    out = df.copy()
-    # Rank within position using consensus_rank if present else rank
-    if "consensus_rank" in out.columns:
-        out["_order"] = out["consensus_rank"].astype(int)
-    elif "rank" in out.columns:
-        out["_order"] = out["rank"].astype(int)
-    else:
-        out["_order"] = range(1, len(out) + 1)
-    out["pos_rank"] = out.sort_values(["pos", "_order"]).groupby("pos").cumcount() + 1
-
-    def compute_vorp(row: pd.Series) -> float:
-        pos = str(row.get("pos", "")).upper()
-        repl = levels.get(pos, 12)
-        val = 1.0 / float(row["pos_rank"]) if float(row["pos_rank"]) > 0 else 0.0
-        repl_val = 1.0 / float(repl)
-        return round(val - repl_val, 4)
-
-    out["VORP"] = out.apply(compute_vorp, axis=1)
-    return out.drop(columns=["_order"], errors="ignore")
-
+    # Rank within position using consensus_rank if present else rank; scratch values stay
+    # in local arrays so the frame is copied once, by the final assign
+    order = _rank_series(df).to_numpy()
+    pos = df["pos"].to_numpy()
+    pos_rank = pd.Series(order).groupby(pos).rank(method="first").to_numpy(dtype=float)
 
+    repl = df["pos"].astype(str).str.upper().map(levels).fillna(12).to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        val = np.where(pos_rank > 0, 1.0 / pos_rank, 0.0)
+    # Rows without a position have no pos_rank (NaN) and keep the column float
+    missing = np.isnan(pos_rank)
+    return df.assign(
+        pos_rank=pos_rank if missing.any() else pos_rank.astype(np.int64),
+        VORP=np.round(val - 1.0 / repl, 4),
+    )
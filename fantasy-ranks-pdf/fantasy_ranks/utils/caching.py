@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 import hashlib
-import json
+import io
 import os
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
+import orjson
+import pandas as pd
 from platformdirs import user_cache_dir
 
 APP_NAME = "fantasy-ranks-pdf"
@@ -15,23 +18,13 @@ CACHE_TTL_ENV = "FANTASY_RANKS_CACHE_TTL_SECONDS"
 DEFAULT_TTL_SECONDS = 3600
 
 
-@dataclass
-class CacheEntry:
-    created_at: datetime
-    data: Any
-
-
 def _cache_dir() -> Path:
     return Path(user_cache_dir(APP_NAME, APP_NAME))
 
 
-def _now() -> datetime:
-    return datetime.now(timezone.utc)
-
-
-def _key_to_path(key: str) -> Path:
+def _key_to_path(key: str, suffix: str = ".json") -> Path:
     digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
-    return _cache_dir() / f"{digest}.json"
+    return _cache_dir() / f"{digest}{suffix}"
 
 
 def get_ttl_seconds() -> int:
@@ -45,23 +38,157 @@ def get_ttl_seconds() -> int:
     return max(0, value)
 
 
-def cache_put(key: str, data: Any) -> None:
-    path = _key_to_path(key)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {"created_at": _now().isoformat(), "data": data}
-    path.write_text(json.dumps(payload))
+# Entries already read or written by this process, most recently used last: repeat lookups
+# skip the stat() and the file read. Values are (cached-at timestamp, payload). Frames are
+# kept decoded and copied per hit; JSON keeps its encoded bytes and is decoded per hit (orjson
+# is fast). Either way callers get their own object and cannot corrupt the cached one.
+_MEM: "OrderedDict[str, Tuple[float, Union[bytes, pd.DataFrame]]]" = OrderedDict()
+_MEM_MAX_ENTRIES = 128
+# Providers reach the cache from asyncio.to_thread workers as well as the loop thread
+_MEM_LOCK = threading.Lock()
 
 
-def cache_get(key: str, *, ttl_seconds: Optional[int] = None) -> Optional[Any]:
-    path = _key_to_path(key)
-    if not path.exists():
-        return None
+def _remember(key: str, entry: Tuple[float, Union[bytes, pd.DataFrame]]) -> None:
+    with _MEM_LOCK:
+        _MEM[key] = entry
+        _MEM.move_to_end(key)
+        if len(_MEM) > _MEM_MAX_ENTRIES:
+            _MEM.popitem(last=False)
+
+
+def _forget(key: str) -> None:
+    with _MEM_LOCK:
+        _MEM.pop(key, None)
+
+
+def _recall(key: str, min_mtime: Optional[float]) -> Optional[Union[bytes, pd.DataFrame]]:
+    with _MEM_LOCK:
+        hit = _MEM.get(key)
+        if hit is None or (min_mtime is not None and hit[0] < min_mtime):
+            return None
+        _MEM.move_to_end(key)
+        return hit[1]
+
+
+def _read_entry(
+    key: str, min_mtime: Optional[float]
+) -> Optional[Tuple[float, Union[bytes, pd.DataFrame]]]:
+    """Read ``key`` from disk as ``(mtime, payload)``; entries older than ``min_mtime`` are not read."""
+    blob = _key_to_path(key, ".parquet")
+    path = blob if blob.exists() else _key_to_path(key)
     try:
-        payload = json.loads(path.read_text())
-        created_at = datetime.fromisoformat(payload["created_at"])  # type: ignore[arg-type]
-        ttl = get_ttl_seconds() if ttl_seconds is None else ttl_seconds
-        if _now() - created_at > timedelta(seconds=ttl):
+        # Check the age before reading so stale entries are never decoded
+        mtime = path.stat().st_mtime
+        if min_mtime is not None and mtime < min_mtime:
             return None
-        return payload["data"]
+        if path is blob:
+            return mtime, pd.read_parquet(blob)
+        return mtime, path.read_bytes()
     except Exception:
         return None
+
+
+def _value(payload: Union[bytes, pd.DataFrame]) -> Any:
+    if isinstance(payload, pd.DataFrame):
+        return payload.copy()
+    return orjson.loads(payload)["data"]
+
+
+def cache_put(key: str, data: Any) -> None:
+    """Store ``data`` under ``key``.
+
+    ``bytes`` values (Parquet blobs) are written verbatim to a ``.parquet`` file; anything
+    else is stored as JSON. Either way the file's mtime records when it was cached.
+    """
+    if isinstance(data, bytes):
+        path = _key_to_path(key, ".parquet")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        # Decoded from disk by the next read
+        _forget(key)
+    else:
+        payload = orjson.dumps({"data": data})
+        path = _key_to_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+        _remember(key, (time.time(), payload))
+
+
+def cache_get(
+    key: str, *, ttl_seconds: Optional[int] = None, allow_stale: bool = False
+) -> Optional[Any]:
+    """Return the value cached under ``key``, or None when missing or older than the TTL.
+
+    Parquet entries come back as DataFrames. ``allow_stale`` skips the age check so callers
+    can revalidate an expired entry.
+    """
+    ttl = get_ttl_seconds() if ttl_seconds is None else ttl_seconds
+    min_mtime = None if allow_stale else time.time() - ttl
+    payload = _recall(key, min_mtime)
+    if payload is None:
+        hit = _read_entry(key, min_mtime)
+        if hit is None:
+            return None
+        _remember(key, hit)
+        payload = hit[1]
+    try:
+        return _value(payload)
+    except Exception:
+        return None
+
+
+def cache_put_frame(key: str, df: pd.DataFrame) -> None:
+    """Cache a DataFrame as a zstd-compressed Parquet blob, preserving its dtypes."""
+    buf = io.BytesIO()
+    df.to_parquet(buf, compression="zstd", index=False)
+    cache_put(key, buf.getvalue())
+    _remember(key, (time.time(), df.copy()))
+
+
+def cache_get_frame(
+    key: str, *, ttl_seconds: Optional[int] = None, allow_stale: bool = False
+) -> Optional[pd.DataFrame]:
+    cached = cache_get(key, ttl_seconds=ttl_seconds, allow_stale=allow_stale)
+    return cached if isinstance(cached, pd.DataFrame) else None
+
+
+def cache_touch(key: str) -> None:
+    """Restart the TTL of the entry under ``key`` (e.g. after a ``304 Not Modified``)."""
+    for path in (_key_to_path(key, ".parquet"), _key_to_path(key)):
+        if path.exists():
+            os.utime(path)
+            break
+    with _MEM_LOCK:
+        hit = _MEM.get(key)
+        if hit is not None:
+            _MEM[key] = (time.time(), hit[1])
+            _MEM.move_to_end(key)
+
+
+# HTTP validators, stored beside the entry so an expired one can be revalidated cheaply
+_VALIDATOR_HEADERS = ("etag", "last-modified")
+
+
+def cache_put_validators(key: str, headers: Mapping[str, str]) -> None:
+    """Remember the ETag / Last-Modified of the response that produced ``key``'s entry."""
+    validators = {name: headers[name] for name in _VALIDATOR_HEADERS if headers.get(name)}
+    path = _key_to_path(key, ".meta.json")
+    if not validators:
+        path.unlink(missing_ok=True)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(validators))
+
+
+def conditional_headers(key: str) -> Dict[str, str]:
+    """``If-None-Match`` / ``If-Modified-Since`` headers for the validators stored under ``key``."""
+    try:
+        validators = orjson.loads(_key_to_path(key, ".meta.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    headers: Dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last-modified"):
+        headers["If-Modified-Since"] = validators["last-modified"]
+    return headers
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict
+import warnings
 
+import numpy as np
 import pandas as pd
 
-
 ProviderName = str
 
+_KEY_COLUMNS = ["_key", "name", "team", "pos"]
+
 
 def _prepare_provider_df(df: pd.DataFrame, provider: ProviderName) -> pd.DataFrame:
     out = df.copy()
@@ -24,13 +27,13 @@ def _prepare_provider_df(df: pd.DataFrame, provider: ProviderName) -> pd.DataFra
         # Fallback: current order
         out["_rank"] = range(1, len(out) + 1)
     # Canonical join key
-    out["_key"] = (
-        out["name"].astype(str).str.strip().str.lower()
-        + "|"
-        + out["pos"].astype(str).str.strip().str.upper()
-    )
-    # Provider-specific columns to keep
-    return out[["_key", "name", "team", "pos", "_rank"]].rename(columns={"_rank": f"rank_{provider}"})
+    name = np.char.lower(np.char.strip(out["name"].to_numpy(dtype=str)))
+    pos = np.char.upper(np.char.strip(out["pos"].to_numpy(dtype=str)))
+    out["_key"] = np.char.add(np.char.add(name, "|"), pos)
+    # Long form: one (player, provider, rank) record per row
+    out = out[_KEY_COLUMNS + ["_rank"]].rename(columns={"_rank": "rank"})
+    # Plain object labels, so grouping sees only the players present (not every category)
+    return out.astype({"team": object, "pos": object}).assign(provider=provider)
 
 
 def build_consensus(providers: Dict[ProviderName, pd.DataFrame]) -> pd.DataFrame:
@@ -39,22 +42,37 @@ def build_consensus(providers: Dict[ProviderName, pd.DataFrame]) -> pd.DataFrame
     Returns columns: name, team, pos, rank_<provider>, delta, consensus_rank
     Delta is defined only for the pair ESPN vs Sleeper if both present; else 0.
     Consensus rank is the mean of available provider ranks, then re-ranked (1..N).
+    Rows are not sorted by it; callers sort when presenting.
     """
-    prepared: List[pd.DataFrame] = []
-    for pname, df in providers.items():
-        prepared.append(_prepare_provider_df(df, pname))
-
-    # Merge on _key
-    merged = prepared[0]
-    for part in prepared[1:]:
-        merged = pd.merge(merged, part, on=["_key", "name", "team", "pos"], how="outer")
+    long = pd.concat(
+        [_prepare_provider_df(df, pname) for pname, df in providers.items()], ignore_index=True
+    )
+    # One pass from long to wide: a rank_<provider> column per provider, in the given order.
+    # groupby keeps players with a missing team; pivot_table(dropna=False) would instead
+    # emit every combination of the index levels.
+    merged = (
+        long.groupby(_KEY_COLUMNS + ["provider"], dropna=False)["rank"]
+        .first()
+        .unstack("provider")
+        .reindex(columns=list(providers))
+        .add_prefix("rank_")
+        .rename_axis(columns=None)
+        .reset_index()
+    )
 
     # Compute consensus mean rank across available provider rank columns
-    rank_cols = [c for c in merged.columns if c.startswith("rank_")]
-    merged["consensus_mean"] = merged[rank_cols].mean(axis=1, skipna=True)
-    # Assign consensus rank (1..N) by ordering mean
-    merged = merged.sort_values(["consensus_mean", "name"]).reset_index(drop=True)
-    merged["consensus_rank"] = range(1, len(merged) + 1)
+    rank_cols = [f"rank_{pname}" for pname in providers]
+    ranks = merged[rank_cols].to_numpy(dtype="float64", na_value=np.nan)
+    with warnings.catch_warnings():
+        # A row with no ranks at all is expected here; it sorts last as +inf below
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(ranks, axis=1)
+    merged["consensus_mean"] = np.where(np.isnan(mean), np.inf, mean)
+    # Assign consensus rank (1..N) by mean without reordering rows; rows are grouped by
+    # _key (lower-cased name first), so ties still break by name
+    merged["consensus_rank"] = (
+        merged["consensus_mean"].rank(method="first", na_option="bottom").astype(int)
+    )
 
     # Delta: ESPN vs Sleeper if present
     espn_col = next((c for c in rank_cols if c == "rank_espn-editorial" or c == "rank_ESPN"), None)
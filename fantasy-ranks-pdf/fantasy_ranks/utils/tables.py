@@ -1,25 +1,137 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from io import StringIO
+import re
+from typing import Dict, Iterable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
-
 REQUIRED_COLUMNS = ["rank", "name", "team", "pos"]
 
+# Layout shared by the editorial providers' parsed ranking tables
+TABLE_FIELDS = ["rank", "name", "team", "pos", "bye"]
+HEADER_FIELDS = {"RK": "rank", "PLAYER": "name", "TEAM": "team", "POS": "pos", "BYE": "bye"}
+_DEFAULT_COLUMNS = {"rank": 0, "name": 1, "team": 2, "pos": 3}
+_WS_RE = re.compile(r"\s+")
+_NBSP_TABLE = str.maketrans({"\xa0": " ", "’": "'"})
+
 
 def ensure_columns(df: pd.DataFrame, *, include_bye: bool) -> pd.DataFrame:
-    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {missing}")
+    # Hashed index difference rather than a list scan per required column
+    missing = pd.Index(REQUIRED_COLUMNS).difference(df.columns, sort=False)
+    if len(missing):
+        raise ValueError(f"Missing required columns: {missing.tolist()}")
+    # Reorder to preferred layout; every column here is known to be present
     cols = REQUIRED_COLUMNS + (["bye"] if include_bye and "bye" in df.columns else [])
-    # Reorder to preferred layout when present
-    available = [c for c in cols if c in df.columns]
-    return df[available].copy()
+    return df[cols]
+
+
+def position_mask(pos: pd.Series, positions: Iterable[str]) -> pd.Series:
+    """Boolean mask of rows whose position is in ``positions`` (case-insensitive).
+
+    Category-typed columns are matched on their integer codes, so only the handful
+    of category labels is upper-cased and hashed rather than every row.
+    """
+    allowed = {p.upper() for p in positions}
+    if isinstance(pos.dtype, pd.CategoricalDtype):
+        codes = [i for i, c in enumerate(pos.cat.categories) if str(c).upper() in allowed]
+        return pd.Series(pos.cat.codes.isin(codes), index=pos.index)
+    return pos.str.upper().isin(allowed)
+
+
+def finalize_rows(
+    df: pd.DataFrame,
+    *,
+    positions: Optional[Iterable[str]],
+    limit: Optional[int],
+    include_def_k: bool,
+) -> pd.DataFrame:
+    """Per-call position, K/DST and ``limit`` selection over a cached, rank-ordered frame.
+
+    One fused mask, then a single positional take; providers cache frames in rank
+    (page) order, so the top N is the first N selected rows rather than nsmallest.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if positions:
+        mask &= position_mask(df["pos"], positions).to_numpy()
+    if not include_def_k:
+        mask &= ~position_mask(df["pos"], ["K", "DST"]).to_numpy()
+    rows = np.flatnonzero(mask)
+    if limit:
+        rows = rows[:limit]
+    return df.iloc[rows].reset_index(drop=True)
 
 
 def filter_positions(df: pd.DataFrame, positions: Optional[Iterable[str]]) -> pd.DataFrame:
     if not positions:
         return df
-    allowed = [p.upper() for p in positions]
-    return df[df["pos"].str.upper().isin(allowed)].copy()
+    return df[position_mask(df["pos"], positions)]
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace and non-breaking spaces; curly apostrophes become straight."""
+    return _WS_RE.sub(" ", text.translate(_NBSP_TABLE)).strip()
+
+
+def clean_series(values: pd.Series) -> pd.Series:
+    """Column-wise :func:`clean_text`; missing cells become empty strings."""
+    cleaned = values.fillna("").astype(str).str.translate(_NBSP_TABLE)
+    return cleaned.str.replace(_WS_RE, " ", regex=True).str.strip()
+
+
+def to_int(values: pd.Series) -> pd.Series:
+    """Nullable integers; blanks, labels and fractional values become <NA>."""
+    numeric = pd.to_numeric(values, errors="coerce")
+    return numeric.where(numeric % 1 == 0).astype("Int64")
+
+
+def frame_from_table(table: pd.DataFrame, header_fields: Dict[str, str]) -> pd.DataFrame:
+    """Select and clean the ranking columns of one ``read_html`` table.
+
+    Headers are looked up in ``header_fields``; unlabeled tables fall back to the
+    RK, PLAYER, TEAM, POS column positions.
+    """
+    headers = [clean_text(str(c[-1] if isinstance(c, tuple) else c)).upper() for c in table.columns]
+    index: Dict[str, int] = {}
+    for i, header in enumerate(headers):
+        field = header_fields.get(header)
+        if field and field not in index:
+            index[field] = i
+    for field, i in _DEFAULT_COLUMNS.items():
+        index.setdefault(field, i)
+    if max(index.values()) >= table.shape[1]:
+        return pd.DataFrame(columns=TABLE_FIELDS)
+    frame = pd.DataFrame({field: table.iloc[:, i] for field, i in index.items()})
+    if "bye" not in frame.columns:
+        frame["bye"] = None
+    return frame.assign(
+        name=clean_series(frame["name"]),
+        team=clean_series(frame["team"]).str.upper(),
+        pos=clean_series(frame["pos"]).str.upper(),
+    )[TABLE_FIELDS]
+
+
+def read_rank_tables(
+    html: str,
+    header_fields: Dict[str, str] = HEADER_FIELDS,
+    *,
+    match: Union[str, re.Pattern[str]] = ".+",
+) -> Optional[pd.DataFrame]:
+    """Extract tables with pandas' lxml reader; None when it cannot parse the page.
+
+    Tables whose text matches ``match`` are read; when none match, every table is,
+    since header-less tables still map by column position. The result has the
+    :data:`TABLE_FIELDS` columns with raw rank, position and bye values.
+    """
+    try:
+        tables = pd.read_html(StringIO(html), flavor="lxml", match=match)
+    except ValueError:
+        if match != ".+":
+            # No table matched; unlabeled rows drop out later with the rank coercion
+            return read_rank_tables(html, header_fields)
+        # No tables on the page
+        return pd.DataFrame(columns=TABLE_FIELDS)
+    except Exception:  # noqa: BLE001
+        return None
+    return pd.concat([frame_from_table(t, header_fields) for t in tables], ignore_index=True)
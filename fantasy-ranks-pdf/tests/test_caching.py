@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from fantasy_ranks.utils import caching
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(caching, "_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(caching, "_MEM", caching.OrderedDict())
+    return tmp_path
+
+
+def test_json_roundtrip_and_ttl():
+    caching.cache_put("state", {"season": "2025"})
+    assert caching.cache_get("state", ttl_seconds=60) == {"season": "2025"}
+    assert caching.cache_get("state", ttl_seconds=-1) is None
+    assert caching.cache_get("missing") is None
+
+
+def test_frame_roundtrip_preserves_dtypes():
+    df = pd.DataFrame(
+        {
+            "rank": pd.array([1, 2], dtype="Int64"),
+            "name": ["A RB", "B WR"],
+            "pos": pd.Categorical(["RB", "WR"]),
+            "bye": pd.array([7, None], dtype="Int64"),
+        }
+    )
+    caching.cache_put_frame("frame", df)
+    out = caching.cache_get_frame("frame", ttl_seconds=60)
+    assert out is not None
+    pd.testing.assert_frame_equal(out, df)
+    assert caching.cache_get_frame("frame", ttl_seconds=-1) is None
+
+
+def test_validators_and_touch_revalidate_expired_entry(isolated_cache):
+    import os
+
+    caching.cache_put_frame("page", pd.DataFrame({"rank": [1]}))
+    caching.cache_put_validators(
+        "page", {"etag": '"abc"', "last-modified": "Tue, 01 Jul 2025 00:00:00 GMT"}
+    )
+    assert caching.conditional_headers("page") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 01 Jul 2025 00:00:00 GMT",
+    }
+    blob = next(isolated_cache.glob("*.parquet"))
+    os.utime(blob, (0, 0))
+    caching._MEM.clear()  # as seen by a later run
+    assert caching.cache_get_frame("page", ttl_seconds=60) is None
+    assert caching.cache_get_frame("page", ttl_seconds=60, allow_stale=True) is not None
+    caching.cache_touch("page")
+    assert caching.cache_get_frame("page", ttl_seconds=60) is not None
+    caching.cache_put_validators("page", {})
+    assert caching.conditional_headers("page") == {}
+
+
+def test_memory_layer_serves_repeat_reads_and_is_bounded(isolated_cache, monkeypatch):
+    monkeypatch.setattr(caching, "_MEM_MAX_ENTRIES", 2)
+    caching.cache_put("a", [1])
+    for path in isolated_cache.iterdir():
+        path.unlink()
+    assert caching.cache_get("a", ttl_seconds=60) == [1]
+    caching.cache_put("b", [2])
+    caching.cache_put("c", [3])
+    assert list(caching._MEM) == ["b", "c"]
+    assert caching.cache_get("a", ttl_seconds=60) is None
+
+
+def test_memory_hits_return_independent_copies(isolated_cache):
+    caching.cache_put("state", {"season": "2025"})
+    caching.cache_get("state", ttl_seconds=60)["season"] = "1999"
+    assert caching.cache_get("state", ttl_seconds=60) == {"season": "2025"}
+
+    df = pd.DataFrame({"rank": [1, 2]})
+    caching.cache_put_frame("frame", df)
+    df.loc[0, "rank"] = 99
+    first = caching.cache_get_frame("frame", ttl_seconds=60)
+    assert first is not None and first["rank"].tolist() == [1, 2]
+    first.loc[1, "rank"] = 42
+    again = caching.cache_get_frame("frame", ttl_seconds=60)
+    assert again is not None and again["rank"].tolist() == [1, 2]
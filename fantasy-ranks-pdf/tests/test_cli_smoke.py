@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import pandas as pd
+import pytest
 from typer.testing import CliRunner
 
+from fantasy_ranks import cli
 from fantasy_ranks.cli import app as typer_app
 
-
 runner = CliRunner()
 
 
@@ -27,3 +29,32 @@ def test_cli_export_smoke(tmp_path, monkeypatch):
     )
     assert result.exit_code == 0, result.output
     assert out.exists() and out.stat().st_size > 0
+
+
+class StubProvider:
+    name = "stub"
+    homepage_url = ""
+
+    def __init__(self):
+        self.calls = []
+
+    def fetch(self, scoring, *, positions=None, limit=None):
+        self.calls.append({"positions": positions, "limit": limit})
+        return pd.DataFrame({"rank": [1], "name": ["A RB"], "team": ["AAA"], "pos": ["RB"]})
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["--positions", "QB, WR", "--only", "RB,TE"], ["RB", "TE"]),
+        (["--positions", "QB,WR"], ["QB", "WR"]),
+        ([], None),
+    ],
+)
+def test_cli_export_pushes_position_filter_into_fetch(monkeypatch, args, expected):
+    stub = StubProvider()
+    monkeypatch.setattr(cli, "_get_provider", lambda source: stub)
+    result = runner.invoke(typer_app, ["--raw", "--limit", "5", *args])
+    assert result.exit_code == 0, result.output
+    # --only wins over --positions, and the provider filters rather than the CLI
+    assert stub.calls == [{"positions": expected, "limit": 5}]
@@ -20,3 +20,36 @@ def test_build_consensus_basic():
     # Ensure order and delta sign
     first = df.iloc[0]
     assert first["name"] in ("A RB", "B WR")
+
+
+def test_tiers_follow_consensus_rank_not_row_order():
+    from fantasy_ranks.utils.analytics import add_tiers
+
+    # Ranks run against the alphabetical _key order build_consensus returns rows in
+    names = ["Zed", "Yan", "Xi", "Wu", "Di", "Cy", "Bo", "Al"]
+    source = pd.DataFrame({"rank": range(1, 9), "name": names, "team": "AAA", "pos": "RB"})
+    df = add_tiers(build_consensus({"espn-editorial": source, "sleeper-adp": source}))
+    by_rank = df.sort_values("consensus_rank")
+    assert by_rank["name"].tolist() == names
+    assert by_rank["tier"].tolist() == list(range(1, 9))
+
+
+def test_vorp_ranks_within_position_with_ties_and_missing_positions():
+    from fantasy_ranks.utils.analytics import add_vorp
+
+    df = pd.DataFrame(
+        {
+            "rank": [3, 1, 3, 2, 5, 4],
+            "name": ["RB3", "RB1", "RB3b", "QB1", "Unknown", "QB2"],
+            "pos": ["RB", "RB", "RB", "QB", None, "QB"],
+        }
+    )
+    out = add_vorp(df, replacement_levels={"rb": 2})
+    # Ties keep page order; a missing position gets no pos_rank and zero value
+    assert out["pos_rank"].tolist()[:4] == [2.0, 1.0, 3.0, 1.0]
+    assert pd.isna(out["pos_rank"].iloc[4]) and out["pos_rank"].iloc[5] == 2.0
+    assert out["VORP"].tolist() == [0.0, 0.5, -0.1667, 0.9167, -0.0833, 0.4167]
+
+    complete = add_vorp(df.dropna(subset=["pos"]))
+    assert complete["pos_rank"].dtype == "int64"
+    assert list(complete.columns) == ["rank", "name", "pos", "pos_rank", "VORP"]
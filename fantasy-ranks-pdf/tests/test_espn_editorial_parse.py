@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from fantasy_ranks.providers.espn_editorial import ESPNEditorialProvider
+
+FIXTURE = Path(__file__).parent / "fixtures" / "espn_editorial_sample.html"
+
+
+def test_parse_html_fixture():
+    provider = ESPNEditorialProvider()
+    html = FIXTURE.read_text()
+    df = provider._parse_html_to_df(html, scoring="ppr", include_def_k=True)
+    assert list(df.columns)[:5] == ["rank", "name", "team", "pos", "bye"]
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert row["rank"] == 1 and row["name"] == "Sample Player"
+    assert row["team"] == "AAA" and row["pos"] == "RB" and row["bye"] == 7
+    assert row["source"] == "espn-editorial" and row["scoring"] == "ppr"
+
+
+def test_parse_html_drops_invalid_positions_and_def_k():
+    provider = ESPNEditorialProvider()
+    html = """
+    <table>
+      <tr><th>RK</th><th>PLAYER</th><th>TEAM</th><th>POS</th><th>BYE</th></tr>
+      <tr><td>1</td><td>Runner</td><td>aaa</td><td>RB</td><td>5</td></tr>
+      <tr><td>2</td><td>Kicker</td><td>BBB</td><td>K</td><td>6</td></tr>
+      <tr><td>3</td><td>Linebacker</td><td>CCC</td><td>LB</td><td></td></tr>
+      <tr><td>4</td><td>Defense</td><td>DDD</td><td>D/ST</td><td>9</td></tr>
+    </table>
+    """
+    df = provider._parse_html_to_df(html, scoring="half", include_def_k=True)
+    assert df["pos"].tolist() == ["RB", "K", "DST"]
+    assert df["team"].iloc[0] == "AAA"
+    df = provider._parse_html_to_df(html, scoring="half", include_def_k=False)
+    assert df["name"].tolist() == ["Runner"]
+
+
+def test_parse_html_reads_header_less_tables():
+    provider = ESPNEditorialProvider()
+    html = """
+    <table>
+      <tr><td>1</td><td>Runner</td><td>AAA</td><td>RB</td><td>5</td></tr>
+      <tr><td>2</td><td>Receiver</td><td>BBB</td><td>WR</td><td>6</td></tr>
+    </table>
+    """
+    df = provider._parse_html_to_df(html, scoring="ppr", include_def_k=True)
+    assert df["name"].tolist() == ["Runner", "Receiver"]
+    assert df["rank"].tolist() == [1, 2]
+
+
+def test_dom_fallback_keeps_typed_columns():
+    provider = ESPNEditorialProvider()
+    provider._read_tables = lambda html: None  # type: ignore[method-assign]
+    html = """
+    <table>
+      <tr><th>RK</th><th>PLAYER</th><th>TEAM</th><th>POS</th><th>BYE</th></tr>
+      <tr><td>Tier 1</td></tr>
+      <tr><td>1</td><td>Runner</td><td>aaa</td><td>RB</td><td>5</td></tr>
+      <tr><td>2</td><td>Defense</td><td>BBB</td><td>D/ST</td><td></td></tr>
+    </table>
+    """
+    df = provider._parse_html_to_df(html, scoring="ppr", include_def_k=True)
+    assert df["name"].tolist() == ["Runner", "Defense"]
+    assert df["pos"].tolist() == ["RB", "DST"]
+    assert df["rank"].dtype == np.int32
+    assert str(df["bye"].dtype) == "Int16"
+    assert df["bye"].iloc[0] == 5 and df["bye"].isna().iloc[1]
@@ -23,6 +23,7 @@ def test_pdf_header_footer_contains_expected_text(tmp_path):
         source_url="https://www.espn.com/fantasy/football/",
         generated_date=date(2025, 1, 1),
         logos_enabled=False,
+        compress=False,
     )
     # Basic PDF header
     assert pdf_bytes.startswith(b"%PDF-1.")
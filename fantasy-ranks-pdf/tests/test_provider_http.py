@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import date
+import os
+
+import httpx
+import pandas as pd
+import pytest
+
+from fantasy_ranks.providers import base, espn_editorial, sleeper_adp
+from fantasy_ranks.providers.base import Provider, run_sync
+from fantasy_ranks.providers.espn_editorial import ESPNEditorialProvider
+from fantasy_ranks.providers.sleeper_adp import SleeperADPProvider
+from fantasy_ranks.providers.yahoo_editorial import YahooEditorialProvider
+from fantasy_ranks.utils import caching
+
+URL = "https://example.test/rankings"
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Serve queued responses through httpx.MockTransport and record requests and sleeps."""
+    state = {"responses": [], "requests": [], "sleeps": []}
+
+    def handler(request):
+        state["requests"].append(request)
+        return state["responses"].pop(0)
+
+    async def fake_sleep(delay):
+        state["sleeps"].append(delay)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(Provider, "async_client", classmethod(lambda cls: client))
+    monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+    return state
+
+
+def test_client_error_fails_without_retrying(transport):
+    transport["responses"] = [httpx.Response(404)]
+    with pytest.raises(RuntimeError, match="ESPN editorial page"):
+        run_sync(ESPNEditorialProvider()._fetch_html(URL))
+    assert len(transport["requests"]) == 1
+    assert transport["sleeps"] == []
+
+
+def test_server_errors_retry_with_exponential_backoff(transport):
+    transport["responses"] = [httpx.Response(503) for _ in range(4)]
+    with pytest.raises(RuntimeError, match="503"):
+        run_sync(ESPNEditorialProvider()._fetch_html(URL))
+    assert len(transport["requests"]) == 4
+    # ~0.5s, 1s, 2s plus up to 0.25s of jitter; no sleep after the last attempt
+    sleeps = transport["sleeps"]
+    assert len(sleeps) == 3
+    for delay, floor in zip(sleeps, (0.5, 1.0, 2.0), strict=True):
+        assert floor <= delay <= floor + 0.25
+
+
+def test_retry_after_is_honored_for_429(transport):
+    transport["responses"] = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, text="<html></html>"),
+    ]
+    resp = run_sync(ESPNEditorialProvider()._fetch_html(URL))
+    assert resp.status_code == 200
+    assert transport["sleeps"] == [0.0]
+    assert transport["requests"][0].headers["Accept"].startswith("text/html")
+
+
+def test_yahoo_shares_the_retry_policy(transport):
+    transport["responses"] = [httpx.Response(500), httpx.Response(200, text="ok")]
+    assert run_sync(YahooEditorialProvider()._fetch_html(URL)) == "ok"
+    assert len(transport["sleeps"]) == 1
+
+    transport["responses"] = [httpx.Response(403)]
+    with pytest.raises(RuntimeError, match="Yahoo editorial page"):
+        run_sync(YahooEditorialProvider()._fetch_html(URL))
+    assert len(transport["requests"]) == 3
+
+
+VALIDATORS = {"etag": '"v1"', "last-modified": "Tue, 01 Jul 2025 00:00:00 GMT"}
+ESPN_KEY = f"v2::espn-editorial::{date.today().year}::ppr::{URL}"
+PAGE = """
+<table>
+  <tr><th>RK</th><th>PLAYER</th><th>TEAM</th><th>POS</th><th>BYE</th></tr>
+  <tr><td>1</td><td>New Runner</td><td>AAA</td><td>RB</td><td>5</td></tr>
+</table>
+"""
+
+
+@pytest.fixture
+def stale_cache(tmp_path, monkeypatch):
+    """Isolated cache whose entries are seeded, given validators and then expired."""
+    monkeypatch.setattr(caching, "_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(caching, "_MEM", caching.OrderedDict())
+
+    def seed(key, df):
+        caching.cache_put_frame(key, df)
+        caching.cache_put_validators(key, VALIDATORS)
+        for path in tmp_path.glob("*.parquet"):
+            os.utime(path, (0, 0))
+        caching._MEM.clear()  # as seen by a later run
+
+    return seed
+
+
+def _record_touches(monkeypatch, module):
+    touched = []
+    real = module.cache_touch
+    monkeypatch.setattr(module, "cache_touch", lambda key: (touched.append(key), real(key)))
+    return touched
+
+
+def test_espn_304_serves_the_stale_frame(transport, stale_cache, monkeypatch):
+    monkeypatch.setenv("FANTASY_RANKS_ESPN_URL", URL)
+    stale_cache(
+        ESPN_KEY,
+        pd.DataFrame({"rank": [1], "name": ["Old Runner"], "team": ["AAA"], "pos": ["RB"]}),
+    )
+    touched = _record_touches(monkeypatch, espn_editorial)
+    transport["responses"] = [httpx.Response(304)]
+
+    df = ESPNEditorialProvider().fetch("ppr")
+    headers = transport["requests"][0].headers
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == VALIDATORS["last-modified"]
+    assert df["name"].tolist() == ["Old Runner"]
+    assert touched == [ESPN_KEY]
+    assert caching.cache_get_frame(ESPN_KEY) is not None
+
+
+def test_espn_keeps_old_validators_when_the_new_page_fails_to_parse(
+    transport, stale_cache, monkeypatch
+):
+    monkeypatch.setenv("FANTASY_RANKS_ESPN_URL", URL)
+    stale_cache(
+        ESPN_KEY,
+        pd.DataFrame({"rank": [1], "name": ["Old Runner"], "team": ["AAA"], "pos": ["RB"]}),
+    )
+    transport["responses"] = [httpx.Response(200, text=PAGE, headers={"etag": '"v2"'})]
+
+    def broken(*args, **kwargs):
+        raise ValueError("layout changed")
+
+    provider = ESPNEditorialProvider()
+    monkeypatch.setattr(provider, "_parse_html_to_df", broken)
+    with pytest.raises(ValueError):
+        provider.fetch("ppr")
+    # The stale frame is still paired with the validators it was fetched with
+    assert caching.conditional_headers(ESPN_KEY)["If-None-Match"] == '"v1"'
+
+    transport["responses"] = [httpx.Response(200, text=PAGE, headers={"etag": '"v2"'})]
+    df = ESPNEditorialProvider().fetch("ppr")
+    assert df["name"].tolist() == ["New Runner"]
+    assert caching.conditional_headers(ESPN_KEY) == {"If-None-Match": '"v2"'}
+
+
+def test_sleeper_players_304_serves_the_stale_map(transport, stale_cache, monkeypatch):
+    key = "v1::sleeper-players-nfl"
+    players = pd.DataFrame({"player_id": ["1"], "name": ["A RB"], "team": ["AAA"], "pos": ["RB"]})
+    stale_cache(key, players)
+    touched = _record_touches(monkeypatch, sleeper_adp)
+    transport["responses"] = [httpx.Response(304)]
+
+    df = run_sync(SleeperADPProvider()._fetch_players())
+    headers = transport["requests"][0].headers
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == VALIDATORS["last-modified"]
+    pd.testing.assert_frame_equal(df, players)
+    assert touched == [key]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import asyncio
+
+from fantasy_ranks.providers.base import run_sync
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_sync_without_and_inside_running_loop():
+    assert run_sync(_answer()) == 42
+
+    async def caller() -> int:
+        # a sync fetch() called from async code, e.g. a notebook cell
+        return run_sync(_answer())
+
+    assert asyncio.run(caller()) == 42
@@ -23,22 +23,25 @@ class DummyResp:
     def json(self):
         return self._data
 
+    @property
+    def content(self):
+        return json.dumps(self._data).encode("utf-8")
+
 
 @pytest.mark.parametrize("lookback_hours", [168])
 def test_sleeper_adp_trending(monkeypatch, lookback_hours):
     provider = SleeperADPProvider()
 
     class DummyClient:
+        is_closed = False
+
         def __init__(self, *args, **kwargs):
             pass
 
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *exc):
-            return False
+        async def aclose(self):
+            self.is_closed = True
 
-        def get(self, url):
+        async def get(self, url, **kwargs):
             if url.endswith("/state/nfl"):
                 return DummyResp({"season": str(date.today().year)})
             if "trending/add" in url:
@@ -55,7 +58,10 @@ def test_sleeper_adp_trending(monkeypatch, lookback_hours):
 
     import httpx
 
-    monkeypatch.setattr(httpx, "Client", DummyClient)  # type: ignore[attr-defined]
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)  # type: ignore[attr-defined]
+    # Bypass any on-disk cache so the dummy client is exercised
+    monkeypatch.setenv("SLEEPER_CACHE_TTL_SECONDS", "0")
+    monkeypatch.setenv("SLEEPER_PLAYERS_CACHE_TTL_SECONDS", "0")
     df = provider.fetch("ppr", limit=2)
     assert list(df.columns)[:4] == ["rank", "name", "team", "pos"]
     assert len(df) == 2
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from fantasy_ranks.utils.tables import finalize_rows
+
+FRAME = pd.DataFrame(
+    {
+        "rank": [1, 2, 3, 4, 5],
+        "name": ["Kicker", "Defense", "Runner", "Receiver", "Back"],
+        "pos": pd.Categorical(["K", "DST", "RB", "WR", "RB"]),
+    }
+)
+
+
+def test_finalize_rows_limits_after_dropping_def_k():
+    # Cached frames keep K/DST; the limit counts only the rows that survive the filters
+    with_def_k = finalize_rows(FRAME, positions=None, limit=3, include_def_k=True)
+    assert with_def_k["name"].tolist() == ["Kicker", "Defense", "Runner"]
+
+    without = finalize_rows(FRAME, positions=None, limit=2, include_def_k=False)
+    assert without["name"].tolist() == ["Runner", "Receiver"]
+    assert without.index.tolist() == [0, 1]
+
+
+def test_finalize_rows_limits_after_position_filter():
+    rbs = finalize_rows(FRAME, positions=["rb"], limit=2, include_def_k=False)
+    assert rbs["name"].tolist() == ["Runner", "Back"]
+    assert finalize_rows(FRAME, positions=["k"], limit=None, include_def_k=False).empty
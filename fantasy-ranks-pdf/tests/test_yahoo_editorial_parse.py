@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from fantasy_ranks.providers.yahoo_editorial import YahooEditorialProvider
+
+HTML = """
+<table>
+  <thead><tr><th>RK</th><th>PLAYER</th><th>TEAM</th><th>POS</th><th>BYE</th></tr></thead>
+  <tbody>
+    <tr><td>1</td><td>Runner&nbsp;One</td><td>aaa</td><td>RB</td><td>7</td></tr>
+    <tr><td colspan="5">Tier 2</td></tr>
+    <tr><td>2</td><td>Defense</td><td>BBB</td><td>D/ST</td><td></td></tr>
+    <tr><td>3</td><td>Linebacker</td><td>CCC</td><td>LB</td><td>9</td></tr>
+  </tbody>
+</table>
+"""
+
+
+def test_read_html_and_dom_fallback_agree():
+    provider = YahooEditorialProvider()
+    df = provider._parse_html_to_df(HTML, scoring="half", include_def_k=True)
+    assert df["name"].tolist() == ["Runner One", "Defense"]
+    assert df["pos"].tolist() == ["RB", "DST"]
+    assert df["team"].iloc[0] == "AAA" and df["bye"].iloc[0] == 7
+    assert (df["scoring"] == "half").all()
+
+    provider._read_tables = lambda html: None  # type: ignore[method-assign]
+    fallback = provider._parse_html_to_df(HTML, scoring="half", include_def_k=False)
+    assert fallback["name"].tolist() == ["Runner One"]